@@ -13,8 +13,7 @@
 #
 # END HEADER
 
-import inspect
-from unittest import TestCase
+import types
 
 import pytest
 
@@ -27,7 +26,7 @@ def test_must_use_result_of_test():
     class DoubleRun:
         def execute_example(self, function):
             x = function()
-            if inspect.isfunction(x):
+            if isinstance(x, types.FunctionType):
                 return x()
 
         @given(booleans())
@@ -41,7 +40,7 @@ def test_must_use_result_of_test():
         DoubleRun().boom()
 
 
-class TestTryReallyHard(TestCase):
+class TestTryReallyHard:
     @given(integers())
     def test_something(self, i):
         pass
@@ -85,7 +84,7 @@ def test_no_boom_on_example():
     Valueless().test_no_boom_on_example()
 
 
-class TestNormal(ConjectureRunner, TestCase):
+class TestNormal(ConjectureRunner):
     @given(booleans())
     def test_stuff(self, b):
         pass
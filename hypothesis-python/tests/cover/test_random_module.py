@@ -13,7 +13,6 @@
 #
 # END HEADER
 
-import gc
 import random
 
 import pytest
@@ -24,34 +23,34 @@ from hypothesis.internal import entropy
 from hypothesis.internal.compat import PYPY
 from hypothesis.internal.entropy import deterministic_PRNG
 
-from tests.common.utils import capture_out
+# CPython uses reference counting, so objects (without circular refs)
+# are collected immediately on `del`, breaking weak references.
+# PyPy doesn't, so we use this function in tests before checking the
+# surviving references to ensure that they're deterministic.
+if PYPY:
+    from gc import collect as gc_on_pypy
+else:
 
-
-def gc_on_pypy():
-    # CPython uses reference counting, so objects (without circular refs)
-    # are collected immediately on `del`, breaking weak references.
-    # PyPy doesn't, so we use this function in tests before counting the
-    # surviving references to ensure that they're deterministic.
-    if PYPY:
-        gc.collect()
+    def gc_on_pypy():
+        pass
 
 
 def test_can_seed_random():
-    with capture_out() as out:
-        with reporting.with_reporter(reporting.default):
-            with pytest.raises(AssertionError):
+    msgs = []
+    with reporting.with_reporter(msgs.append):
+        with pytest.raises(AssertionError):
 
-                @given(st.random_module())
-                def test(r):
-                    raise AssertionError
+            @given(st.random_module())
+            def test(r):
+                raise AssertionError
 
-                test()
-    assert "RandomSeeder(0)" in out.getvalue()
+            test()
+    assert any("RandomSeeder(0)" in m for m in msgs)
 
 
 @given(st.random_module(), st.random_module())
 def test_seed_random_twice(r, r2):
-    assert repr(r) == repr(r2)
+    assert repr(r) == repr(r2) == f"RandomSeeder({r.seed})"
 
 
 @given(st.random_module())
@@ -65,20 +64,29 @@ def test_cannot_register_non_Random():
 
 
 def test_registering_a_Random_is_idempotent():
-    gc_on_pypy()
-    n_registered = len(entropy.RANDOMS_TO_MANAGE)
+    snap = set(entropy.RANDOMS_TO_MANAGE)
     r = random.Random()
     register_random(r)
     register_random(r)
-    assert len(entropy.RANDOMS_TO_MANAGE) == n_registered + 1
+    (k,) = set(entropy.RANDOMS_TO_MANAGE) - snap
+    assert entropy.RANDOMS_TO_MANAGE[k] is r
     del r
     gc_on_pypy()
-    assert len(entropy.RANDOMS_TO_MANAGE) == n_registered
+    assert k not in entropy.RANDOMS_TO_MANAGE
 
 
-def test_manages_registered_Random_instance():
+@pytest.fixture(scope="module")
+def managed_random():
+    # There's no way to unregister a Random; the entry in RANDOMS_TO_MANAGE
+    # goes away by itself once this reference is dropped at module teardown.
     r = random.Random()
     register_random(r)
+    yield r
+
+
+def test_manages_registered_Random_instance(managed_random):
+    r = managed_random
+    r.seed(0)
     state = r.getstate()
     result = []
 
@@ -94,9 +102,9 @@ def test_manages_registered_Random_instance():
     assert state == r.getstate()
 
 
-def test_registered_Random_is_seeded_by_random_module_strategy():
-    r = random.Random()
-    register_random(r)
+def test_registered_Random_is_seeded_by_random_module_strategy(managed_random):
+    r = managed_random
+    r.seed(0)
     state = r.getstate()
     results = set()
     count = [0]
@@ -120,43 +128,44 @@ def test_will_actually_use_the_random_seed(rnd):
     assert b == random.randint(0, 100)
 
 
-def test_given_does_not_pollute_state():
+@pytest.fixture
+def deterministic_prng_ctx():
     with deterministic_PRNG():
+        yield
 
-        @given(st.random_module())
-        def test(r):
-            pass
 
-        test()
-        state_a = random.getstate()
-        state_a2 = core._hypothesis_global_random.getstate()
+def test_given_does_not_pollute_state(deterministic_prng_ctx):
+    @given(st.random_module())
+    def test(r):
+        pass
 
+    states = []
+    for _ in range(2):
         test()
-        state_b = random.getstate()
-        state_b2 = core._hypothesis_global_random.getstate()
+        states.append((random.getstate(), core._hypothesis_global_random.getstate()))
+    (state_a, state_a2), (state_b, state_b2) = states
 
-        assert state_a == state_b
-        assert state_a2 != state_b2
+    assert state_a == state_b
+    assert state_a2 != state_b2
 
 
-def test_find_does_not_pollute_state():
-    with deterministic_PRNG():
+def test_find_does_not_pollute_state(deterministic_prng_ctx):
+    find(st.random_module(), lambda r: True)
+    state_a = random.getstate()
+    state_a2 = core._hypothesis_global_random.getstate()
 
-        find(st.random_module(), lambda r: True)
-        state_a = random.getstate()
-        state_a2 = core._hypothesis_global_random.getstate()
+    find(st.random_module(), lambda r: True)
+    state_b = random.getstate()
+    state_b2 = core._hypothesis_global_random.getstate()
 
-        find(st.random_module(), lambda r: True)
-        state_b = random.getstate()
-        state_b2 = core._hypothesis_global_random.getstate()
-
-        assert state_a == state_b
-        assert state_a2 != state_b2
+    assert state_a == state_b
+    assert state_a2 != state_b2
 
 
 def test_evil_prng_registration_nonsense():
-    gc_on_pypy()
-    n_registered = len(entropy.RANDOMS_TO_MANAGE)
+    # Comparing against a snapshot of the keys means that we don't care
+    # whether Randoms from earlier tests are collected while this one runs.
+    snap = set(entropy.RANDOMS_TO_MANAGE)
     r1, r2, r3 = random.Random(1), random.Random(2), random.Random(3)
     s2 = r2.getstate()
 
@@ -164,15 +173,15 @@ def test_evil_prng_registration_nonsense():
     # drop one and add another, and finally check that we reset only
     # the states that we collected before we started
     register_random(r1)
-    k = max(entropy.RANDOMS_TO_MANAGE)  # get a handle to check if r1 still exists
+    (k1,) = set(entropy.RANDOMS_TO_MANAGE) - snap  # handle to check r1 exists
     register_random(r2)
-    assert len(entropy.RANDOMS_TO_MANAGE) == n_registered + 2
+    (k2,) = set(entropy.RANDOMS_TO_MANAGE) - snap - {k1}
 
     with deterministic_PRNG(0):
         del r1
         gc_on_pypy()
-        assert k not in entropy.RANDOMS_TO_MANAGE, "r1 has been garbage-collected"
-        assert len(entropy.RANDOMS_TO_MANAGE) == n_registered + 1
+        assert k1 not in entropy.RANDOMS_TO_MANAGE, "r1 has been garbage-collected"
+        assert set(entropy.RANDOMS_TO_MANAGE) - snap == {k2}
 
         r2.seed(4)
         register_random(r3)
@@ -32,28 +32,33 @@ from tests.common.debug import (
     minimal,
 )
 
+_TZ = timezones()
+_DUBLIN = just(pytz.timezone("Europe/Dublin"))
+_SYDNEY = just(pytz.timezone("Australia/Sydney"))
+
+_LO_BOUND = dt.datetime.min + dt.timedelta(days=3)
+_HI_BOUND = dt.datetime.max - dt.timedelta(days=3)
+
+_BOUND_NAMES = sampled_from(["min_value", "max_value"])
+
 
 def test_utc_is_minimal():
-    assert pytz.UTC is minimal(timezones())
+    assert pytz.UTC is minimal(_TZ)
 
 
 def test_can_generate_non_naive_time():
-    assert minimal(times(timezones=timezones()), lambda d: d.tzinfo).tzinfo == pytz.UTC
+    assert minimal(times(timezones=_TZ), lambda d: d.tzinfo).tzinfo == pytz.UTC
 
 
 def test_can_generate_non_naive_datetime():
-    assert (
-        minimal(datetimes(timezones=timezones()), lambda d: d.tzinfo).tzinfo == pytz.UTC
-    )
-
-
-@given(datetimes(timezones=timezones()))
-def test_timezone_aware_datetimes_are_timezone_aware(dt):
-    assert dt.tzinfo is not None
+    assert minimal(datetimes(timezones=_TZ), lambda d: d.tzinfo).tzinfo == pytz.UTC
 
 
-@given(sampled_from(["min_value", "max_value"]), datetimes(timezones=timezones()))
+@given(_BOUND_NAMES, datetimes(timezones=_TZ))
 def test_datetime_bounds_must_be_naive(name, val):
+    # Checking that we generated an aware datetime also covers the property
+    # that datetimes(timezones=...) are timezone-aware, without a second test.
+    assert val.tzinfo is not None
     with pytest.raises(InvalidArgument):
         datetimes(**{name: val}).validate()
 
@@ -61,9 +66,7 @@ def test_datetime_bounds_must_be_naive(name, val):
 def test_underflow_in_simplify():
     # we shouldn't trigger a pytz bug when we're simplifying
     minimal(
-        datetimes(
-            max_value=dt.datetime.min + dt.timedelta(days=3), timezones=timezones()
-        ),
+        datetimes(max_value=_LO_BOUND, timezones=_TZ),
         lambda x: x.tzinfo != pytz.UTC,
     )
 
@@ -71,9 +74,7 @@ def test_underflow_in_simplify():
 def test_overflow_in_simplify():
     # we shouldn't trigger a pytz bug when we're simplifying
     minimal(
-        datetimes(
-            min_value=dt.datetime.max - dt.timedelta(days=3), timezones=timezones()
-        ),
+        datetimes(min_value=_HI_BOUND, timezones=_TZ),
         lambda x: x.tzinfo != pytz.UTC,
     )
 
@@ -82,37 +83,36 @@ def test_timezones_arg_to_datetimes_must_be_search_strategy():
     with pytest.raises(InvalidArgument):
         datetimes(timezones=pytz.all_timezones).validate()
     with pytest.raises(InvalidArgument):
-        tz = [pytz.timezone(t) for t in pytz.all_timezones]
-        datetimes(timezones=tz).validate()
+        datetimes(timezones=[pytz.UTC, pytz.timezone("Europe/Dublin")]).validate()
 
 
-@given(times(timezones=timezones()))
+@given(times(timezones=_TZ))
 def test_timezone_aware_times_are_timezone_aware(dt):
     assert dt.tzinfo is not None
 
 
 def test_can_generate_non_utc():
-    times(timezones=timezones()).filter(
+    times(timezones=_TZ).filter(
         lambda d: assume(d.tzinfo) and d.tzinfo.zone != "UTC"
     ).validate()
 
 
-@given(sampled_from(["min_value", "max_value"]), times(timezones=timezones()))
+@given(_BOUND_NAMES, times(timezones=_TZ))
 def test_time_bounds_must_be_naive(name, val):
     with pytest.raises(InvalidArgument):
         times(**{name: val}).validate()
 
 
 @pytest.mark.parametrize(
-    "bound",
+    "strategy",
     [
-        {"min_value": dt.datetime.max - dt.timedelta(days=3)},
-        {"max_value": dt.datetime.min + dt.timedelta(days=3)},
+        datetimes(min_value=_HI_BOUND, timezones=_TZ),
+        datetimes(max_value=_LO_BOUND, timezones=_TZ),
     ],
 )
-def test_can_trigger_error_in_draw_near_boundary(bound):
+def test_can_trigger_error_in_draw_near_boundary(strategy):
     assert_can_trigger_event(
-        datetimes(**bound, timezones=timezones()),
+        strategy,
         lambda event: "Failed to draw a datetime" in event,
     )
 
@@ -121,7 +121,7 @@ def test_can_trigger_error_in_draw_near_boundary(bound):
 def test_datetimes_stay_within_naive_bounds(data, lo, hi):
     if lo > hi:
         lo, hi = hi, lo
-    out = data.draw(datetimes(lo, hi, timezones=timezones()))
+    out = data.draw(datetimes(lo, hi, timezones=_TZ))
     assert lo <= out.replace(tzinfo=None) <= hi
 
 
@@ -135,14 +135,14 @@ def test_datetimes_stay_within_naive_bounds(data, lo, hi):
         {
             "min_value": dt.datetime(2019, 3, 31),
             "max_value": dt.datetime(2019, 4, 1),
-            "timezones": just(pytz.timezone("Europe/Dublin")),
+            "timezones": _DUBLIN,
         },
         # The day of a spring-forward transition in Australia; 2am is imaginary
         # (the common case so an optimistic `is_dst=bool(fold)` also fails the test)
         {
             "min_value": dt.datetime(2020, 10, 4),
             "max_value": dt.datetime(2020, 10, 5),
-            "timezones": just(pytz.timezone("Australia/Sydney")),
+            "timezones": _SYDNEY,
         },
     ],
 )
@@ -13,6 +13,8 @@
 #
 # END HEADER
 
+import re
+
 import pytest
 
 from hypothesis import given
@@ -109,20 +111,40 @@ def things(draw):
 
 
 @given(st.data(), st.integers())
-def test(data, x):
+def {name}(data, x):
     if x > 100:
         data.draw({strategy})
         raise {exception}
 """
 
 
-@pytest.mark.parametrize("exc_name", ["SystemExit", "GeneratorExit"])
-@pytest.mark.parametrize("use_composite", [True, False])
-def test_explanations(testdir, exc_name, use_composite):
-    code = TEMPLATE.format(
-        exception=exc_name, strategy="things()" if use_composite else "st.none()"
+def _make_source(name, exc_name, use_composite):
+    return TEMPLATE.format(
+        name=name,
+        exception=exc_name,
+        strategy="things()" if use_composite else "st.none()",
     )
-    test_file = str(testdir.makepyfile(code))
-    pytest_stdout = str(testdir.runpytest_inprocess(test_file, "--tb=native").stdout)
-    assert "x=101" in pytest_stdout
-    assert exc_name in pytest_stdout
+
+
+def test_explanations(testdir):
+    # Write every case into one directory and run them in a single pytest
+    # session, rather than paying for a separate inprocess run per case.
+    cases = {}
+    for exc_name in ["SystemExit", "GeneratorExit"]:
+        for use_composite in [True, False]:
+            name = f"test_{exc_name}_{'composite' if use_composite else 'none'}"
+            cases[name] = exc_name
+            testdir.makepyfile(**{name: _make_source(name, exc_name, use_composite)})
+    pytest_stdout = str(testdir.runpytest_inprocess("--tb=native").stdout)
+
+    # Failure reports are headed by "____ test_name ____"; split on those
+    # and drop the trailing summary so each case is checked on its own.
+    _, *sections = re.split(r"_{3,} (test_\w+) _{3,}", pytest_stdout)
+    reports = {
+        name: report.split("\n=")[0]
+        for name, report in zip(sections[::2], sections[1::2])
+    }
+    assert reports.keys() == cases.keys()
+    for name, exc_name in cases.items():
+        assert "x=101" in reports[name]
+        assert exc_name in reports[name]